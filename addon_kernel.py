@@ -0,0 +1,24 @@
+# Numba-compiled add-on aggregation for large add-on selections. The app
+# imports this lazily, only when a selection is big enough to benefit,
+# because importing numba itself is slow.
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def aggregate_addons(is_flat, lows, highs, qtys):
+    n = lows.shape[0]
+    row_lows = np.empty(n)
+    row_highs = np.empty(n)
+    total_low = 0.0
+    total_high = 0.0
+    
+    for i in range(n):
+        # Flat add-ons ignore the quantity
+        qty = 1.0 if is_flat[i] else qtys[i]
+        row_lows[i] = lows[i] * qty
+        row_highs[i] = highs[i] * qty
+        total_low += row_lows[i]
+        total_high += row_highs[i]
+    
+    return total_low, total_high, row_lows, row_highs
@@ -1,5 +1,10 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
+
+# Add-on pricing types as integer codes; unknown types price like flat
+PRICING_FLAT, PRICING_PER_SQFT, PRICING_PER_UNIT = 0, 1, 2
+PRICING_CODES = {'flat': PRICING_FLAT, 'per_sqft': PRICING_PER_SQFT, 'per_unit': PRICING_PER_UNIT}
+PRICING_LABELS = {PRICING_FLAT: "Flat", PRICING_PER_SQFT: "Per sq.ft", PRICING_PER_UNIT: "Per unit"}
 
 # Page configuration with dark theme
 st.set_page_config(
@@ -9,129 +14,187 @@ st.set_page_config(
 )
 
 # Custom CSS for dark theme and mobile responsiveness
+@st.cache_data
+def load_css():
+    with open('styles.css') as f:
+        return f.read()
+
+st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
+
+# Header section
 st.markdown("""
-<style>
-    /* Dark theme styling */
-    .stApp {
-        background-color: #0E1117;
-    }
-    
-    /* Header styling */
-    .main-header {
-        background: linear-gradient(135deg, #1f2937 0%, #111827 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-    }
-    
-    .company-name {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #10B981;
-        margin-bottom: 0.5rem;
-    }
-    
-    .company-tagline {
-        font-size: 1.2rem;
-        color: #9CA3AF;
-    }
-    
-    /* Results section styling */
-    .results-container {
-        background: linear-gradient(135deg, #1f2937 0%, #374151 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        margin-top: 2rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-    }
-    
-    .cost-breakdown {
-        background-color: #1f2937;
-        padding: 1.5rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    
-    .final-total {
-        background: linear-gradient(135deg, #059669 0%, #047857 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        text-align: center;
-        margin-top: 2rem;
-        box-shadow: 0 6px 12px rgba(5, 150, 105, 0.4);
-    }
-    
-    .final-total h2 {
-        color: white;
-        font-size: 2rem;
-        margin-bottom: 1rem;
-    }
-    
-    .final-price {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #D1FAE5;
-    }
-    
-    /* Mobile responsiveness */
-    @media (max-width: 768px) {
-        .company-name {
-            font-size: 1.8rem;
-        }
-        
-        .company-tagline {
-            font-size: 1rem;
-        }
-        
-        .final-price {
-            font-size: 2rem;
-        }
-    }
-    
-    /* Button styling */
-    .stButton>button {
-        width: 100%;
-        padding: 1rem;
-        font-size: 1.2rem;
-        font-weight: bold;
-        border-radius: 8px;
-    }
-</style>
+<div class="main-header">
+    <div class="company-name">🏗️ Olive Contractors</div>
+    <div class="company-tagline">Professional Construction Cost Estimator</div>
+</div>
 """, unsafe_allow_html=True)
 
-# Load CSV data files
+# Load reference data files
 @st.cache_data
 def load_data():
+    # Imported here so pandas loads after the page shell has been sent
+    import pandas as pd
+    from reference_data import RefData, load_table
+    
     try:
-        project_types = pd.read_csv('PROJECT_TYPES.csv')
-        finish_levels = pd.read_csv('FINISH_LEVELS.csv')
-        structural_complexity = pd.read_csv('STRUCTURAL_COMPLEXITY.csv')
-        add_ons = pd.read_csv('ADD_ONS.csv')
-        config = pd.read_csv('CONFIG.csv')
+        # Parquet snapshots from build_refdata.py when fresh, otherwise the CSVs
+        project_types = load_table('PROJECT_TYPES')
+        finish_levels = load_table('FINISH_LEVELS')
+        structural_complexity = load_table('STRUCTURAL_COMPLEXITY')
+        add_ons = load_table('ADD_ONS')
+        config = load_table('CONFIG')
         
-        # Convert config to dictionary
+        # Convert config to dictionary, parsing the numeric settings once here
         config_dict = dict(zip(config['Key'], config['Value']))
+        for key in ('default_contingency_percent', 'default_contractor_markup_percent'):
+            config_dict[key] = float(config_dict[key])
         
-        return project_types, finish_levels, structural_complexity, add_ons, config_dict
+        add_ons['pricing_type_code'] = add_ons['pricing_type'].map(PRICING_CODES).fillna(PRICING_FLAT).astype(np.int8)
+        add_ons['price_range'] = [f"${low:,.0f} - ${high:,.0f} CAD" for low, high in zip(add_ons['low'], add_ons['high'])]
+        
+        # Group add-ons per project; projects without add-ons get empty groups
+        addon_groups = dict(tuple(add_ons.groupby('project_type_id')))
+        project_addons = {
+            project_id: addon_groups.get(project_id, add_ons.iloc[:0])
+            for project_id in project_types['project_type_id']
+        }
+        
+        # Base table for the add-on data_editor, one per project
+        addon_editor_df = {
+            project_id: pd.DataFrame({
+                'Select': False,
+                'Add-on': group['name'].tolist(),
+                'Price range': group['price_range'].tolist(),
+                'Pricing': [PRICING_LABELS[code] for code in group['pricing_type_code']],
+                'Qty': pd.array([
+                    50 if code == PRICING_PER_SQFT else 1 if code == PRICING_PER_UNIT else None
+                    for code in group['pricing_type_code']
+                ], dtype='Int64'),
+                'Notes': group['notes'].tolist(),
+            })
+            for project_id, group in project_addons.items()
+        }
+        
+        # Selectbox label -> id mappings
+        project_type_options = dict(zip(project_types['name'], project_types['project_type_id']))
+        finish_level_options = dict(zip(finish_levels['label'], finish_levels['finish_level_id']))
+        complexity_options = dict(zip(structural_complexity['label'], structural_complexity['complexity_id']))
+        
+        # Rows indexed by id so each rerun does a dict lookup instead of a DataFrame scan,
+        # and add-on columns as NumPy arrays for the cost math
+        return RefData(
+            config=config_dict,
+            contingency_pct=config_dict['default_contingency_percent'] / 100.0,
+            markup_pct=config_dict['default_contractor_markup_percent'] / 100.0,
+            project_by_id=project_types.set_index('project_type_id').to_dict('index'),
+            finish_by_id=finish_levels.set_index('finish_level_id').to_dict('index'),
+            complexity_by_id=structural_complexity.set_index('complexity_id').to_dict('index'),
+            addons_by_project={pid: group.to_dict('records') for pid, group in project_addons.items()},
+            addon_ids={pid: group['addon_id'].to_numpy(dtype=object) for pid, group in project_addons.items()},
+            addon_low={pid: group['low'].to_numpy(dtype=np.float64) for pid, group in project_addons.items()},
+            addon_high={pid: group['high'].to_numpy(dtype=np.float64) for pid, group in project_addons.items()},
+            addon_pricing={pid: group['pricing_type_code'].to_numpy() for pid, group in project_addons.items()},
+            addon_editor_df=addon_editor_df,
+            project_type_options=project_type_options,
+            project_type_names=list(project_type_options.keys()),
+            finish_level_options=finish_level_options,
+            finish_level_labels=list(finish_level_options.keys()),
+            complexity_options=complexity_options,
+            complexity_labels=list(complexity_options.keys())
+        )
     except Exception as e:
         st.error(f"Error loading data files: {e}")
-        return None, None, None, None, None
+        return None
 
 # Load data
-project_types_df, finish_levels_df, complexity_df, add_ons_df, config = load_data()
+refdata = load_data()
 
-# Header section
-st.markdown("""
-<div class="main-header">
-    <div class="company-name">🏗️ Olive Contractors</div>
-    <div class="company-tagline">Professional Construction Cost Estimator</div>
-</div>
-""", unsafe_allow_html=True)
+# Selections at least this large use the Numba kernel when numba is
+# installed; below it the NumPy expressions beat the kernel call overhead
+NUMBA_MIN_ADDONS = 32
+
+# numba is optional; without it every selection takes the NumPy path
+def load_addon_kernel():
+    try:
+        from addon_kernel import aggregate_addons
+    except ImportError:
+        return None
+    return aggregate_addons
+
+# Cost calculation, cached on its inputs so unrelated reruns skip the math.
+# addons is a tuple of (addon_id, qty) pairs so it is a hashable cache key.
+@st.cache_data
+def compute_estimate(project_id, sqft, finish_id, complexity_id, addons):
+    project_info = refdata.project_by_id[project_id]
+    finish_info = refdata.finish_by_id[finish_id]
+    complexity_info = refdata.complexity_by_id[complexity_id]
+    
+    # Low and high figures are carried together as [low, high] pairs
+    base_cost = np.maximum(
+        sqft * np.array([project_info['base_cost_per_sqft_low'], project_info['base_cost_per_sqft_high']]),
+        project_info['min_project_cost']
+    )
+    
+    # Apply finish level and structural complexity multipliers
+    after_finish = base_cost * finish_info['multiplier']
+    after_complexity = after_finish * complexity_info['multiplier']
+    
+    # Calculate add-ons total over the selected rows
+    addon_qty_by_id = dict(addons)
+    selected_rows = np.flatnonzero(np.isin(refdata.addon_ids[project_id], list(addon_qty_by_id)))
+    is_flat = refdata.addon_pricing[project_id][selected_rows] == PRICING_FLAT
+    qtys = np.array([addon_qty_by_id[addon_id] for addon_id in refdata.addon_ids[project_id][selected_rows]], dtype=np.float64)
+    lows = refdata.addon_low[project_id][selected_rows]
+    highs = refdata.addon_high[project_id][selected_rows]
+    
+    aggregate_addons = load_addon_kernel() if len(selected_rows) >= NUMBA_MIN_ADDONS else None
+    if aggregate_addons is not None:
+        addons_total_low, addons_total_high, addon_lows, addon_highs = aggregate_addons(is_flat, lows, highs, qtys)
+    else:
+        addon_qtys = np.where(is_flat, 1.0, qtys)
+        addon_lows = lows * addon_qtys
+        addon_highs = highs * addon_qtys
+        addons_total_low = addon_lows.sum()
+        addons_total_high = addon_highs.sum()
+    
+    addon_details = [
+        {'name': refdata.addons_by_project[project_id][row]['name'], 'low': low, 'high': high}
+        for row, low, high in zip(selected_rows, addon_lows, addon_highs)
+    ]
+    
+    # Subtotal before contingency and markup
+    addons_total = np.array([addons_total_low, addons_total_high])
+    subtotal = after_complexity + addons_total
+    
+    # Apply contingency
+    contingency = subtotal * refdata.contingency_pct
+    after_contingency = subtotal + contingency
+    
+    # Apply contractor markup
+    markup = after_contingency * refdata.markup_pct
+    final_total = after_contingency + markup
+    
+    stages = {
+        'base_cost': base_cost,
+        'after_finish': after_finish,
+        'after_complexity': after_complexity,
+        'addons_total': addons_total,
+        'subtotal': subtotal,
+        'contingency': contingency,
+        'after_contingency': after_contingency,
+        'markup': markup,
+        'final_total': final_total,
+    }
+    estimate = {
+        f"{stage}_{bound}": pair[i]
+        for stage, pair in stages.items()
+        for i, bound in enumerate(('low', 'high'))
+    }
+    estimate['addon_details'] = addon_details
+    return estimate
 
 # Check if data loaded successfully
-if project_types_df is None:
+if refdata is None:
     st.error("Failed to load data files. Please ensure all CSV files are present.")
     st.stop()
 
@@ -143,233 +206,209 @@ if 'show_results' not in st.session_state:
 st.markdown("### Project Details")
 
 # Project Type Selection
-project_type_options = dict(zip(project_types_df['name'], project_types_df['project_type_id']))
 selected_project_name = st.selectbox(
     "Select Project Type",
-    options=list(project_type_options.keys()),
+    options=refdata.project_type_names,
     help="Choose the type of construction project"
 )
-selected_project_id = project_type_options[selected_project_name]
+selected_project_id = refdata.project_type_options[selected_project_name]
 
 # Get project details
-project_info = project_types_df[project_types_df['project_type_id'] == selected_project_id].iloc[0]
+project_info = refdata.project_by_id[selected_project_id]
 
 # Show project description
 st.info(f"📋 {project_info['description']}")
 
-# Square Footage Input
-st.markdown("### Project Size")
-square_footage = st.number_input(
-    "Square Footage",
-    min_value=1,
-    value=500,
-    step=50,
-    help="Enter the total square footage of the project"
-)
-
 # Finish Level Selection
 st.markdown("### Finish Level")
-finish_level_options = dict(zip(finish_levels_df['label'], finish_levels_df['finish_level_id']))
 selected_finish_label = st.selectbox(
     "Select Finish Level",
-    options=list(finish_level_options.keys()),
+    options=refdata.finish_level_labels,
     index=1,  # Default to "Standard"
     help="Choose the quality level of finishes"
 )
-selected_finish_id = finish_level_options[selected_finish_label]
+selected_finish_id = refdata.finish_level_options[selected_finish_label]
 
 # Show finish level description
-finish_info = finish_levels_df[finish_levels_df['finish_level_id'] == selected_finish_id].iloc[0]
+finish_info = refdata.finish_by_id[selected_finish_id]
 st.caption(f"ℹ️ {finish_info['description']} (Multiplier: {finish_info['multiplier']}x)")
 
 # Structural Complexity Selection
 st.markdown("### Structural Complexity")
-complexity_options = dict(zip(complexity_df['label'], complexity_df['complexity_id']))
 selected_complexity_label = st.selectbox(
     "Structural Changes",
-    options=list(complexity_options.keys()),
+    options=refdata.complexity_labels,
     help="Select the level of structural modifications required"
 )
-selected_complexity_id = complexity_options[selected_complexity_label]
+selected_complexity_id = refdata.complexity_options[selected_complexity_label]
 
 # Show complexity description
-complexity_info = complexity_df[complexity_df['complexity_id'] == selected_complexity_id].iloc[0]
+complexity_info = refdata.complexity_by_id[selected_complexity_id]
 st.caption(f"ℹ️ {complexity_info['description']} (Multiplier: {complexity_info['multiplier']}x)")
 
-# Add-ons Section
-st.markdown("### Add-ons & Upgrades")
-
-# Filter add-ons for selected project type
-relevant_addons = add_ons_df[add_ons_df['project_type_id'] == selected_project_id]
-selected_addons = []
-addon_sqft_inputs = {}
-
-if len(relevant_addons) > 0:
-    st.markdown("**Select additional features:**")
+# Size, add-ons and the calculate button share a form so edits there only
+# rerun the script on submit; the selectboxes above stay live because the
+# add-on table and the descriptions depend on them
+with st.form('estimator_form', border=False):
+    # Square Footage Input
+    st.markdown("### Project Size")
+    square_footage = st.number_input(
+        "Square Footage",
+        min_value=1,
+        value=500,
+        step=50,
+        help="Enter the total square footage of the project"
+    )
     
-    for idx, addon in relevant_addons.iterrows():
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            is_selected = st.checkbox(
-                f"{addon['name']} (${addon['low']:,.0f} - ${addon['high']:,.0f} CAD)",
-                key=f"addon_{addon['addon_id']}"
-            )
-            st.caption(f"💡 {addon['notes']}")
+    # Add-ons Section
+    st.markdown("### Add-ons & Upgrades")
+    
+    # Filter add-ons for selected project type
+    relevant_addons = refdata.addons_by_project[selected_project_id]
+    selected_addons = []
+    addon_sqft_inputs = {}
+    
+    if len(relevant_addons) > 0:
+        st.markdown("**Select additional features:**")
         
-        with col2:
-            # If pricing type is per_sqft or per_unit, add quantity input
-            if is_selected and addon['pricing_type'] in ['per_sqft', 'per_unit']:
-                qty = st.number_input(
-                    f"Qty",
+        # One editable table instead of a checkbox/caption/qty widget set per add-on
+        edited_addons = st.data_editor(
+            refdata.addon_editor_df[selected_project_id],
+            column_config={
+                'Select': st.column_config.CheckboxColumn("Select"),
+                'Qty': st.column_config.NumberColumn(
+                    "Qty",
                     min_value=1,
-                    value=50 if addon['pricing_type'] == 'per_sqft' else 1,
-                    key=f"qty_{addon['addon_id']}"
-                )
-                addon_sqft_inputs[addon['addon_id']] = qty
+                    step=1,
+                    help="Square footage or unit count, used only when Pricing is Per sq.ft or Per unit; Flat add-ons are charged once"
+                ),
+            },
+            disabled=['Add-on', 'Price range', 'Pricing', 'Notes'],
+            hide_index=True,
+            width='stretch',
+            key=f"addon_editor_{selected_project_id}"
+        )
         
-        if is_selected:
+        # A cleared Qty cell falls back to a quantity of 1
+        ignored_qty_addons = []
+        for addon, is_selected, qty, has_qty in zip(
+            relevant_addons,
+            edited_addons['Select'],
+            edited_addons['Qty'].fillna(1),
+            edited_addons['Qty'].notna()
+        ):
+            if not is_selected:
+                continue
             selected_addons.append(addon)
-else:
-    st.info("No add-ons available for this project type.")
-
-# Calculate Button
-st.markdown("---")
-if st.button("📊 CALCULATE ESTIMATE", type="primary", use_container_width=True):
-    st.session_state.show_results = True
+            # Quantities only apply to per_sqft / per_unit pricing
+            if addon['pricing_type_code'] in (PRICING_PER_SQFT, PRICING_PER_UNIT):
+                addon_sqft_inputs[addon['addon_id']] = int(qty)
+            elif has_qty:
+                ignored_qty_addons.append(addon['name'])
+        
+        if ignored_qty_addons:
+            st.warning(f"Qty is ignored for flat-priced add-ons, which are charged once: {', '.join(ignored_qty_addons)}")
+    else:
+        st.info("No add-ons available for this project type.")
+    
+    # Calculate Button
+    st.markdown("---")
+    if st.form_submit_button("📊 CALCULATE ESTIMATE", type="primary", width='stretch'):
+        st.session_state.show_results = True
 
 # Results Section
 if st.session_state.show_results:
     st.markdown("---")
     st.markdown("## 💰 Cost Estimate Breakdown")
     
-    # Get configuration values
-    contingency_percent = float(config['default_contingency_percent'])
-    markup_percent = float(config['default_contractor_markup_percent'])
-    currency = config['currency']
-    
-    # Calculate base cost
-    base_cost_low = max(
-        square_footage * project_info['base_cost_per_sqft_low'],
-        project_info['min_project_cost']
-    )
-    base_cost_high = max(
-        square_footage * project_info['base_cost_per_sqft_high'],
-        project_info['min_project_cost']
+    # Configuration values shown in the breakdown text
+    contingency_percent = refdata.config['default_contingency_percent']
+    markup_percent = refdata.config['default_contractor_markup_percent']
+    currency = refdata.config['currency']
+    
+    estimate_inputs = (
+        selected_project_id,
+        square_footage,
+        selected_finish_id,
+        selected_complexity_id,
+        tuple((addon['addon_id'], addon_sqft_inputs.get(addon['addon_id'], 1)) for addon in selected_addons)
     )
     
-    # Apply finish level multiplier
-    finish_multiplier = finish_info['multiplier']
-    after_finish_low = base_cost_low * finish_multiplier
-    after_finish_high = base_cost_high * finish_multiplier
-    
-    # Apply structural complexity multiplier
-    complexity_multiplier = complexity_info['multiplier']
-    after_complexity_low = after_finish_low * complexity_multiplier
-    after_complexity_high = after_finish_high * complexity_multiplier
-    
-    # Calculate add-ons total
-    addons_total_low = 0
-    addons_total_high = 0
-    addon_details = []
-    
-    for addon in selected_addons:
-        if addon['pricing_type'] == 'flat':
-            addon_low = addon['low']
-            addon_high = addon['high']
-        elif addon['pricing_type'] in ['per_sqft', 'per_unit']:
-            qty = addon_sqft_inputs.get(addon['addon_id'], 1)
-            addon_low = addon['low'] * qty
-            addon_high = addon['high'] * qty
-        else:
-            addon_low = addon['low']
-            addon_high = addon['high']
+    # Rebuild the breakdown text only when the inputs change; reruns with the
+    # same inputs re-emit the strings kept in session state
+    if st.session_state.get('_last_render_key') != estimate_inputs:
+        estimate = compute_estimate(*estimate_inputs)
         
-        addons_total_low += addon_low
-        addons_total_high += addon_high
-        addon_details.append({
-            'name': addon['name'],
-            'low': addon_low,
-            'high': addon_high
-        })
-    
-    # Subtotal before contingency and markup
-    subtotal_low = after_complexity_low + addons_total_low
-    subtotal_high = after_complexity_high + addons_total_high
-    
-    # Apply contingency
-    contingency_low = subtotal_low * (contingency_percent / 100)
-    contingency_high = subtotal_high * (contingency_percent / 100)
-    
-    after_contingency_low = subtotal_low + contingency_low
-    after_contingency_high = subtotal_high + contingency_high
-    
-    # Apply contractor markup
-    markup_low = after_contingency_low * (markup_percent / 100)
-    markup_high = after_contingency_high * (markup_percent / 100)
+        # One markdown block per column; dollar signs are escaped so Streamlit
+        # does not read a pair of them as inline LaTeX
+        breakdown = {}
+        for bound, title in (('low', "Low Estimate"), ('high', "High Estimate")):
+            lines = [
+                f"**{title}**",
+                f"Base Construction Cost: \\${estimate[f'base_cost_{bound}']:,.2f} {currency}",
+                f"× Finish Level ({finish_info['label']}): \\${estimate[f'after_finish_{bound}']:,.2f} {currency}",
+                f"× Structural ({complexity_info['label']}): \\${estimate[f'after_complexity_{bound}']:,.2f} {currency}",
+            ]
+            
+            if len(estimate['addon_details']) > 0:
+                lines.append("**Add-ons:**")
+                lines.extend(
+                    f"• {addon['name']}: \\${addon[bound]:,.2f} {currency}"
+                    for addon in estimate['addon_details']
+                )
+            
+            lines.append(f"**Subtotal: \\${estimate[f'subtotal_{bound}']:,.2f} {currency}**")
+            lines.append(f"+ Contingency ({contingency_percent}%): \\${estimate[f'contingency_{bound}']:,.2f} {currency}")
+            lines.append(f"+ Contractor Markup ({markup_percent}%): \\${estimate[f'markup_{bound}']:,.2f} {currency}")
+            
+            breakdown[bound] = "  \n".join(lines)
+        
+        # Midpoint of each low/high pair for the cost distribution table
+        cost_averages = np.array([
+            estimate['after_complexity_low'] + estimate['after_complexity_high'],
+            estimate['addons_total_low'] + estimate['addons_total_high'],
+            estimate['contingency_low'] + estimate['contingency_high'],
+            estimate['markup_low'] + estimate['markup_high'],
+        ]) * 0.5
+        
+        st.session_state['_last_render_key'] = estimate_inputs
+        st.session_state['last_render'] = {
+            'breakdown': breakdown,
+            'cost_distribution': {'Amount': {
+                label: f"${average:,.0f} {currency}"
+                for label, average in zip(
+                    ("Construction Cost", "Add-ons", "Contingency", "Contractor Margin"),
+                    cost_averages
+                )
+            }},
+            'final_total': f"""
+    <div class="final-total">
+        <h2>TOTAL PROJECT ESTIMATE</h2>
+        <div class="final-price">${estimate['final_total_low']:,.0f} - ${estimate['final_total_high']:,.0f} {currency}</div>
+        <p style="color: #D1FAE5; margin-top: 1rem; font-size: 1.1rem;">
+            {project_info['name']} • {square_footage:,} sq ft • Toronto / GTA
+        </p>
+    </div>
+    """,
+        }
     
-    final_total_low = after_contingency_low + markup_low
-    final_total_high = after_contingency_high + markup_high
+    rendered = st.session_state['last_render']
     
     # Display breakdown
     st.markdown('<div class="cost-breakdown">', unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Low Estimate**")
-        st.write(f"Base Construction Cost: ${base_cost_low:,.2f} {currency}")
-        st.write(f"× Finish Level ({finish_info['label']}): ${after_finish_low:,.2f} {currency}")
-        st.write(f"× Structural ({complexity_info['label']}): ${after_complexity_low:,.2f} {currency}")
-        
-        if len(addon_details) > 0:
-            st.write(f"**Add-ons:**")
-            for addon in addon_details:
-                st.write(f"  • {addon['name']}: ${addon['low']:,.2f} {currency}")
-        
-        st.write(f"**Subtotal: ${subtotal_low:,.2f} {currency}**")
-        st.write(f"+ Contingency ({contingency_percent}%): ${contingency_low:,.2f} {currency}")
-        st.write(f"+ Contractor Markup ({markup_percent}%): ${markup_low:,.2f} {currency}")
-    
-    with col2:
-        st.markdown("**High Estimate**")
-        st.write(f"Base Construction Cost: ${base_cost_high:,.2f} {currency}")
-        st.write(f"× Finish Level ({finish_info['label']}): ${after_finish_high:,.2f} {currency}")
-        st.write(f"× Structural ({complexity_info['label']}): ${after_complexity_high:,.2f} {currency}")
-        
-        if len(addon_details) > 0:
-            st.write(f"**Add-ons:**")
-            for addon in addon_details:
-                st.write(f"  • {addon['name']}: ${addon['high']:,.2f} {currency}")
-        
-        st.write(f"**Subtotal: ${subtotal_high:,.2f} {currency}**")
-        st.write(f"+ Contingency ({contingency_percent}%): ${contingency_high:,.2f} {currency}")
-        st.write(f"+ Contractor Markup ({markup_percent}%): ${markup_high:,.2f} {currency}")
+    col1.markdown(rendered['breakdown']['low'])
+    col2.markdown(rendered['breakdown']['high'])
     
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Cost Distribution - Simple version without Plotly
     st.markdown("### Cost Distribution")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.metric("Construction Cost", f"${(after_complexity_low + after_complexity_high)/2:,.0f} {currency}")
-        st.metric("Add-ons", f"${(addons_total_low + addons_total_high)/2:,.0f} {currency}")
-    
-    with col2:
-        st.metric("Contingency", f"${(contingency_low + contingency_high)/2:,.0f} {currency}")
-        st.metric("Contractor Margin", f"${(markup_low + markup_high)/2:,.0f} {currency}")
+    st.table(rendered['cost_distribution'])
     
     # Final Total Display
-    st.markdown(f"""
-    <div class="final-total">
-        <h2>TOTAL PROJECT ESTIMATE</h2>
-        <div class="final-price">${final_total_low:,.0f} - ${final_total_high:,.0f} {currency}</div>
-        <p style="color: #D1FAE5; margin-top: 1rem; font-size: 1.1rem;">
-            {project_info['name']} • {square_footage:,} sq ft • Toronto / GTA
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(rendered['final_total'], unsafe_allow_html=True)
     
     # Notes
     st.markdown("---")
@@ -0,0 +1,20 @@
+# Converts the reference CSVs into Parquet snapshots under refdata/ so the
+# estimator can load pre-parsed, typed tables. Re-run after editing a CSV:
+#
+#     python build_refdata.py
+import os
+
+import pandas as pd
+
+from reference_data import REFDATA_DIR, TABLES, snapshot_path
+
+
+def build():
+    os.makedirs(REFDATA_DIR, exist_ok=True)
+    for name, dtypes in TABLES.items():
+        pd.read_csv(f"{name}.csv", dtype=dtypes).to_parquet(snapshot_path(name), index=False)
+        print(f"Wrote {snapshot_path(name)}")
+
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,63 @@
+# Reference data shared by the estimator app and build_refdata.py: the table
+# schema, the Parquet snapshot locations and the RefData container that
+# load_data() returns. It lives in its own module so st.cache_data can
+# unpickle RefData.
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+REFDATA_DIR = 'refdata'
+
+# Reference table name -> dtypes of its numeric columns
+TABLES = {
+    'PROJECT_TYPES': {
+        'base_cost_per_sqft_low': np.float64,
+        'base_cost_per_sqft_high': np.float64,
+        'min_project_cost': np.float64
+    },
+    'FINISH_LEVELS': {'multiplier': np.float64},
+    'STRUCTURAL_COMPLEXITY': {'multiplier': np.float64},
+    'ADD_ONS': {'low': np.float64, 'high': np.float64},
+    'CONFIG': {},
+}
+
+
+# Reference data as used by the app: id-indexed rows, selectbox options,
+# contingency/markup as fractions and, per project, add-on columns as NumPy
+# arrays in addons_by_project row order
+@dataclass(frozen=True)
+class RefData:
+    config: dict
+    contingency_pct: float
+    markup_pct: float
+    project_by_id: dict
+    finish_by_id: dict
+    complexity_by_id: dict
+    addons_by_project: dict
+    addon_ids: dict
+    addon_low: dict
+    addon_high: dict
+    addon_pricing: dict
+    addon_editor_df: dict
+    project_type_options: dict
+    project_type_names: list
+    finish_level_options: dict
+    finish_level_labels: list
+    complexity_options: dict
+    complexity_labels: list
+
+
+def snapshot_path(name):
+    return os.path.join(REFDATA_DIR, f"{name}.parquet")
+
+
+def load_table(name):
+    csv_path = f"{name}.csv"
+    snapshot = snapshot_path(name)
+    
+    # Only trust the snapshot while it is at least as new as its CSV
+    if os.path.exists(snapshot) and os.path.getmtime(snapshot) >= os.path.getmtime(csv_path):
+        return pd.read_parquet(snapshot)
+    return pd.read_csv(csv_path, dtype=TABLES[name])